@@ -58,6 +58,13 @@ echo "🛑 Stopping existing container..."
 docker stop my-briefings-app || true
 docker rm my-briefings-app || true
 
+# Create missing tables before the app starts (it skips DDL at startup)
+echo "🗄️ Creating database schema..."
+docker run --rm \
+    -e PYTHONPATH=/app \
+    my-briefings-app:latest \
+    python main.py --create-schema
+
 # Run new container
 echo "🚀 Starting Docker container..."
 docker run -d \
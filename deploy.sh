@@ -41,6 +41,10 @@ echo "📦 Installing Python dependencies..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Create missing tables before the app starts (it skips DDL at startup)
+echo "🗄️ Creating database schema..."
+python main.py --create-schema
+
 # Set up systemd service
 echo "⚙️ Setting up systemd service..."
 sudo cp fastapi-app.service /etc/systemd/system/
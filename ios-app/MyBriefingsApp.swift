@@ -43,7 +43,10 @@ struct FeedItem: Codable {
     let id: Int
     let title: String?
     let summary: String?
+    // /feed sends a content preview; the full content comes from /feed/{id}
     let content: String?
+    let content_preview: String?
+    let content_truncated: Bool?
     let url: String?
     let source: String?
     let published_at: String?
@@ -205,6 +208,11 @@ class APIService: ObservableObject {
         return try JSONDecoder().decode([FeedItem].self, from: data)
     }
     
+    func fetchFeedItem(id: Int) async throws -> FeedItem {
+        let data = try await makeRequest(endpoint: "/feed/\(id)")
+        return try JSONDecoder().decode(FeedItem.self, from: data)
+    }
+    
     // MARK: - AI Summary
     func getAISummaryStatus() async throws -> AISummaryStatus {
         let data = try await makeRequest(endpoint: "/ai-summary/status")
@@ -538,7 +546,7 @@ struct FeedView: View {
             }
             
             ForEach(feedItems, id: \.id) { item in
-                ArticleRow(feedItem: item)
+                ArticleRow(apiService: apiService, feedItem: item)
             }
         }
         .navigationTitle("My Feed")
@@ -631,8 +639,15 @@ struct FeedView: View {
 }
 
 struct ArticleRow: View {
+    let apiService: APIService
     let feedItem: FeedItem
     @State private var isExpanded = false
+    @State private var fullContent: String?
+    
+    // The full text once loaded, else the preview the feed list shipped
+    private var displayContent: String? {
+        fullContent ?? feedItem.content ?? feedItem.content_preview
+    }
     
     var body: some View {
         VStack(alignment: .leading, spacing: 8) {
@@ -669,7 +684,7 @@ struct ArticleRow: View {
                     Divider()
                     
                     // Full content if available
-                    if let content = feedItem.content, !content.isEmpty, content != feedItem.summary {
+                    if let content = displayContent, !content.isEmpty, content != feedItem.summary {
                         VStack(alignment: .leading, spacing: 4) {
                             Text("Full Article")
                                 .font(.caption)
@@ -738,6 +753,15 @@ struct ArticleRow: View {
         }
         .padding(.vertical, 4)
         .animation(.easeInOut(duration: 0.3), value: isExpanded)
+        .task(id: isExpanded) {
+            await loadFullContent()
+        }
+    }
+    
+    private func loadFullContent() async {
+        // Only fetch when expanded and the feed list cut the content short
+        guard isExpanded, fullContent == nil, feedItem.content_truncated == true else { return }
+        fullContent = try? await apiService.fetchFeedItem(id: feedItem.id).content
     }
     
     private func timeAgo(from dateString: String?) -> String {
@@ -916,7 +940,7 @@ struct CategoryFeedView: View {
             }
             
             ForEach(feedItems, id: \.id) { item in
-                ArticleRow(feedItem: item)
+                ArticleRow(apiService: apiService, feedItem: item)
             }
         }
         .navigationTitle(category.short_summary ?? category.category_name)
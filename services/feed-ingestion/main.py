@@ -992,6 +992,15 @@ async def get_category_status(user_id: int, db: SessionLocal = Depends(get_db)):
         "category_status": category_status
     }
 
+# Derivatives prompt, built once; only the phrase varies per call
+DERIVATIVES_PROMPT_TEMPLATE = (
+    'Consider the phrase "{phrase}". For this phrase, please respond ONLY in JSON to the following questions: '
+    '1. What is an up to 4 word summary of this phrase? The JSON key for this should be "summary" and the value should be a string. '
+    '2. What are the most popular subreddits that discuss the topic in this phrase? The JSON key for this should be "reddit" and the value should be a list of subreddit names as strings. '
+    '3. What are the most popular twitter handles and hashtags to learn about the topic in the phrase on twitter? The JSON key for this should be "twitter" and the value should be a list of strings, each string being either a handle (starting with @) or a hashtag (starting with #).'
+    ' Respond ONLY with a single JSON object with these three keys: "summary", "reddit", and "twitter".'
+)
+
 @app.post("/perplexity/derivatives")
 async def perplexity_derivatives(request: Request):
     data = await request.json()
@@ -999,13 +1008,7 @@ async def perplexity_derivatives(request: Request):
     if not phrase:
         return {"error": "Missing text"}
     # Build the explicit prompt with JSON key details
-    prompt = (
-        f'Consider the phrase "{phrase}". For this phrase, please respond ONLY in JSON to the following questions: '
-        '1. What is an up to 4 word summary of this phrase? The JSON key for this should be "summary" and the value should be a string. '
-        '2. What are the most popular subreddits that discuss the topic in this phrase? The JSON key for this should be "reddit" and the value should be a list of subreddit names as strings. '
-        '3. What are the most popular twitter handles and hashtags to learn about the topic in the phrase on twitter? The JSON key for this should be "twitter" and the value should be a list of strings, each string being either a handle (starting with @) or a hashtag (starting with #).'
-        ' Respond ONLY with a single JSON object with these three keys: "summary", "reddit", and "twitter".'
-    )
+    prompt = DERIVATIVES_PROMPT_TEMPLATE.format(phrase=phrase)
     perplexity_api_key = os.getenv("PERPLEXITY_API_KEY")
     if not perplexity_api_key:
         return {"error": "PERPLEXITY_API_KEY not set in environment"}
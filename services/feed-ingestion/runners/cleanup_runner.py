@@ -9,6 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from shared.database.connection import get_db
 from shared.models.database_models import FeedItem, DataSource, UserCategory
 from celery_app import celery_app
+from utils.feed_cache import invalidate_feed_cache
 
 
 class CleanupRunner:
@@ -29,6 +30,7 @@ class CleanupRunner:
             ).delete()
 
             db.commit()
+            invalidate_feed_cache()
 
             print(f"[CLEANUP] Deleted {deleted_count} feed items older than {hours_old} hours")
 
@@ -70,6 +72,7 @@ class CleanupRunner:
             ).delete()
 
             db.commit()
+            invalidate_feed_cache()
 
             if deleted_count > 0:
                 print(f"[CLEANUP] Deleted {deleted_count} old {source_name} items for user {user_id}")
@@ -103,6 +106,7 @@ class CleanupRunner:
             ).delete()
 
             db.commit()
+            invalidate_feed_cache()
 
             if deleted_count > 0:
                 print(f"[CLEANUP] Deleted {deleted_count} old {source_name} items for category '{category_name}'")
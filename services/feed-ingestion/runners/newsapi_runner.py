@@ -16,6 +16,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 from shared.database.connection import SessionLocal, engine
 from shared.models.database_models import DataSource, FeedItem, IngestionJob
 from celery_app import celery_app
+from utils.feed_cache import invalidate_feed_cache
 
 load_dotenv()
 
@@ -324,8 +325,8 @@ class NewsAPIRunner:
                         "category_name": category_name
                     }
                 
+                # Flushed together at commit, which batches the INSERTs (insertmanyvalues)
                 self.db.add(feed_item)
-                self.db.flush()  # Get the ID
                 saved_items.append(feed_item)
                 created += 1
                 
@@ -334,6 +335,7 @@ class NewsAPIRunner:
                 continue
         
         self.db.commit()
+        invalidate_feed_cache()
         print(f"[DEBUG] Saved {created} NewsAPI articles to database")
         
         # Now apply AI filtering if enabled
@@ -379,6 +381,7 @@ class NewsAPIRunner:
                                 relevant_count += 1
                     
                     self.db.commit()
+                    invalidate_feed_cache()
                     print(f"[DEBUG] AI filtering completed: {len(saved_items)} -> {relevant_count} articles marked as relevant")
                     
                     # Log filtering stats
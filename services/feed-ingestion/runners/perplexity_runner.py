@@ -17,6 +17,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 from shared.database.connection import SessionLocal, engine
 from shared.models.database_models import DataSource, FeedItem, IngestionJob, ContentCache, UserCategory, UserDB
 from celery_app import celery_app
+from utils.feed_cache import invalidate_feed_cache
 
 load_dotenv()
 
@@ -390,8 +391,8 @@ class PerplexityRunner:
                         "category_name": category_name
                     }
                 
+                # Flushed together at commit, which batches the INSERTs (insertmanyvalues)
                 self.db.add(feed_item)
-                self.db.flush()  # Get the ID
                 saved_items.append(feed_item)
                 created += 1
                 
@@ -400,6 +401,7 @@ class PerplexityRunner:
                 continue
         
         self.db.commit()
+        invalidate_feed_cache()
         print(f"[DEBUG] Saved {created} Perplexity articles to database")
         
         # Now apply AI filtering if enabled
@@ -445,6 +447,7 @@ class PerplexityRunner:
                                 relevant_count += 1
                     
                     self.db.commit()
+                    invalidate_feed_cache()
                     print(f"[DEBUG] AI filtering completed: {len(saved_items)} -> {relevant_count} articles marked as relevant")
                     
                     # Log filtering stats
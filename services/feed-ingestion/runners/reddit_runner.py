@@ -4,6 +4,7 @@ import json
 import time
 import feedparser
 import re
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from celery import current_task
@@ -18,6 +19,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 from shared.database.connection import SessionLocal, engine
 from shared.models.database_models import DataSource, FeedItem, IngestionJob
 from celery_app import celery_app
+from utils.feed_cache import invalidate_feed_cache
 
 load_dotenv()
 
@@ -266,6 +268,7 @@ class RedditRunner:
         try:
             print(f"[DEBUG] Committing {created} posts to database...")
             self.db.commit()
+            invalidate_feed_cache()
             print(f"[DEBUG] Successfully committed {created} Reddit posts to database")
             
             # Verify the posts were actually saved
@@ -329,6 +332,7 @@ class RedditRunner:
                                 relevant_count += 1
                     
                     self.db.commit()
+                    invalidate_feed_cache()
                     print(f"[DEBUG] AI filtering completed: {len(saved_items)} -> {relevant_count} posts marked as relevant")
                     
                     # Log filtering stats
@@ -432,11 +436,20 @@ def ingest_reddit_with_category(self, subreddits: list = None, category_name: st
     print(f"[DEBUG] ===== Finished ingest_reddit_with_category =====")
     return {"status": "completed", "created": total_created, "subreddits_processed": len(subreddits), "category": category_name}
 
+@lru_cache(maxsize=1024)
+def parse_subreddits(raw: str) -> tuple:
+    """Decode a category's stored subreddits JSON into bare, deduplicated names.
+
+    Cached by the raw string: many users share a category (e.g. the default one) and so the
+    exact same stored list, which is then decoded once per worker instead of once per user.
+    """
+    # Remove 'r/' prefix if present and deduplicate
+    return tuple(set(sub.replace('r/', '') for sub in json.loads(raw)))
+
 @celery_app.task(bind=True)
 def ingest_reddit_for_user(self, user_id: int):
     """Trigger Reddit ingestion for a specific user based on their categories"""
     from shared.models.database_models import UserCategory
-    import json
     db = SessionLocal()
     user_categories = db.query(UserCategory).filter(UserCategory.user_id == user_id).all()
     
@@ -448,9 +461,7 @@ def ingest_reddit_for_user(self, user_id: int):
     for user_category in user_categories:
         if user_category.subreddits:
             try:
-                subreddits = json.loads(user_category.subreddits)
-                # Remove 'r/' prefix if present and deduplicate
-                clean_subreddits = list(set([sub.replace('r/', '') for sub in subreddits]))
+                clean_subreddits = list(parse_subreddits(user_category.subreddits))
                 
                 # Use short_summary for category if available, otherwise fallback to category_name
                 category_for_saving = user_category.short_summary if user_category.short_summary else user_category.category_name
@@ -470,12 +481,13 @@ def ingest_reddit_for_user(self, user_id: int):
 def ingest_reddit_for_all_users(self):
     """Trigger Reddit ingestion for all users with categories"""
     from shared.models.database_models import UserCategory
-    import json
     
     db = SessionLocal()
     
-    # Get all users with categories
-    user_categories = db.query(UserCategory).filter(
+    # Get all users with categories (only the columns used for scheduling)
+    user_categories = db.query(
+        UserCategory.user_id, UserCategory.category_name, UserCategory.short_summary, UserCategory.subreddits
+    ).filter(
         UserCategory.is_active == True
     ).all()
     
@@ -492,6 +504,9 @@ def ingest_reddit_for_all_users(self):
     
     total_scheduled = 0
     users_processed = 0
+    # (category, subreddits) pairs already scheduled this run; users sharing a category would
+    # otherwise each queue an identical scrape of the same subreddits into the same category
+    scheduled = set()
     
     try:
         for user_id, categories in users_with_categories.items():
@@ -508,13 +523,17 @@ def ingest_reddit_for_all_users(self):
             for user_category in categories:
                 if user_category.subreddits:
                     try:
-                        subreddits = json.loads(user_category.subreddits)
-                        # Remove 'r/' prefix if present and deduplicate
-                        clean_subreddits = list(set([sub.replace('r/', '') for sub in subreddits]))
+                        clean_subreddits = parse_subreddits(user_category.subreddits)
                         
                         # Use short_summary for category if available, otherwise fallback to category_name
                         category_for_saving = user_category.short_summary if user_category.short_summary else user_category.category_name
                         
+                        key = (category_for_saving, frozenset(clean_subreddits))
+                        if key in scheduled:
+                            continue
+                        scheduled.add(key)
+                        clean_subreddits = list(clean_subreddits)
+                        
                         # Schedule Reddit ingestion for this category
                         ingest_reddit_with_category.apply_async(args=[clean_subreddits, category_for_saving])
                         total_scheduled += 1
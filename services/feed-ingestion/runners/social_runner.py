@@ -13,6 +13,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '../../../'))
 from shared.database.connection import SessionLocal
 from shared.models.database_models import DataSource, FeedItem, IngestionJob, ContentCache
 from celery_app import celery_app
+from utils.feed_cache import invalidate_feed_cache
 
 load_dotenv()
 
@@ -236,6 +237,7 @@ class SocialRunner:
                 continue
         
         self.db.commit()
+        invalidate_feed_cache()
         return {"created": created, "updated": updated}
 
 @celery_app.task(bind=True)
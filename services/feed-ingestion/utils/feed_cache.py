@@ -0,0 +1,19 @@
+import os
+
+import redis
+
+# Same Redis and generation key as the API's feed read cache (main.py). Bumping the counter after
+# runners commit feed item changes makes the API bypass pages it cached before the rows landed.
+REDIS_URL = os.getenv("REDIS_URL")  # Optional; nothing to invalidate when unset
+FEED_CACHE_GENERATION_KEY = "feed:generation"
+
+feed_cache = redis.from_url(REDIS_URL) if REDIS_URL else None
+
+def invalidate_feed_cache():
+    """Drop the API's cached feed pages and items after feed items are written or deleted"""
+    if feed_cache is None:
+        return
+    try:
+        feed_cache.incr(FEED_CACHE_GENERATION_KEY)
+    except Exception as e:
+        print(f"[ERROR] Feed cache invalidation failed: {e}")
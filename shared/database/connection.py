@@ -23,6 +23,9 @@ else:
     # PostgreSQL configuration for production
     engine = create_engine(
         DATABASE_URL,
+        pool_size=10,
+        max_overflow=20,
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "5")),  # fail fast when workers exhaust the pool
         pool_pre_ping=True,
         pool_recycle=300,
         echo=False
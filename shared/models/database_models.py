@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, JSON, Float, Index, UniqueConstraint, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -75,6 +75,10 @@ class FeedItem(Base):
         Index('idx_feed_items_category', 'category'),
         Index('idx_feed_items_processed', 'is_processed'),
         Index('idx_feed_items_relevant', 'is_relevant'),
+        Index(
+            'ix_feed_relevant_cat_pub_id', 'category', text('published_at DESC'), text('id DESC'),
+            postgresql_where=text('is_relevant'), postgresql_include=['created_at']
+        ),
     )
 
 class IngestionJob(Base):
@@ -117,6 +121,12 @@ class UserCategory(Base):
     keywords = Column(JSON)  # Array of keywords for this category
     sources = Column(JSON)  # Preferred sources for this category
     is_active = Column(Boolean, default=True)
+    
+    __table_args__ = (
+        # Same constraint as main.py, so it exists whichever service creates the table; its
+        # (user_id, category_name) index also serves the per-user category lookups
+        UniqueConstraint('user_id', 'category_name', name='unique_user_category'),
+    )
 
 class UserDB(Base):
     """User model (moved from main.py for shared access)"""
@@ -1,10 +1,15 @@
 // Version: 2025-07-22-01 - Force cache refresh
-// Escape HTML to prevent XSS
+// Escape HTML to prevent XSS (also quotes, since values are interpolated into attributes)
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
 function escapeHtml(text) {
     if (!text) return '';
-    const div = document.createElement('div');
-    div.textContent = text;
-    return div.innerHTML;
+    return String(text).replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]);
+}
+
+// Verbose client logging; off in production so feed loads don't pay for formatting/retaining log args
+const DEBUG = false;
+function dlog(...args) {
+    if (DEBUG) console.log(...args);
 }
 
 let feedRefreshInterval = null;
@@ -31,10 +36,13 @@ function stopPeriodicFeedRefresh() {
 
 // Call this after login, after adding/deleting a category, or on page load
 document.addEventListener('DOMContentLoaded', function() {
+    document.getElementById('feed-items').addEventListener('click', handleFeedItemsClick);
+    document.getElementById('categories-list').addEventListener('click', handleCategoriesClick);
     let currentToken = localStorage.getItem('token');
     if (currentToken) {
         showFeed();
         startPeriodicFeedRefresh();
+        startAgeTimer();
     }
 });
 
@@ -81,9 +89,10 @@ async function login() {
         const data = await response.json();
         
         if (response.ok) {
-            localStorage.setItem('token', data.access_token);
+            storeToken(data.access_token);
             showFeed();
             startPeriodicFeedRefresh();
+            startAgeTimer();
         } else {
             showError(data.detail);
         }
@@ -142,9 +151,10 @@ async function signup() {
                 
                 if (loginResponse.ok) {
                     const loginData = await loginResponse.json();
-                    localStorage.setItem('token', loginData.access_token);
+                    storeToken(loginData.access_token);
                     showFeed();
                     startPeriodicFeedRefresh();
+                    startAgeTimer();
                 } else {
                     showError('Account created but login failed. Please try logging in manually.');
                 }
@@ -161,93 +171,179 @@ async function signup() {
 
 let currentOffset = 0;
 const FEED_LIMIT = 30;
+// Cards show at most ~500 characters collapsed and fetch /feed/{id} on expand, so ask for no more
+const FEED_PREVIEW_CHARS = 500;
 let currentCategoryFilter = null;
 
+// Categories only change through addCategory/deleteCategory, so paging and filtering reuse the
+// rendered list and /feed/bundle skips them until this expires or is reset.
+const CATEGORIES_CACHE_MS = 60000;
+let categoriesLoadedAt = 0;
+
+// Token changes also drop everything cached for the previous session
+function storeToken(token) {
+    localStorage.setItem('token', token);
+    categoriesLoadedAt = 0;
+    clearFeedPageCache();
+}
+
+function clearToken() {
+    localStorage.removeItem('token');
+    categoriesLoadedAt = 0;
+    clearFeedPageCache();
+}
+
+// In-flight feed/categories requests; a newer call aborts the older one so a late response
+// can't overwrite the page with stale data
+let feedAbort = null;
+let categoriesAbort = null;
+
+function feedBundleUrl(offset, categoryFilter) {
+    let url = `/feed/bundle?limit=${FEED_LIMIT}&offset=${offset}&preview_chars=${FEED_PREVIEW_CHARS}`;
+    if (categoryFilter) {
+        url += `&category=${encodeURIComponent(categoryFilter)}`;
+    }
+    if (Date.now() - categoriesLoadedAt < CATEGORIES_CACHE_MS) {
+        url += '&include_categories=false';
+    }
+    return url;
+}
+
+// Recently shown and prefetched feed pages, keyed by (offset, category) in LRU order, so paging back
+// and forth (and "Next" after an idle prefetch) renders without a network wait. Entries expire after
+// FEED_PAGE_CACHE_MS and everything is dropped whenever categories or feeds change.
+const FEED_PAGE_CACHE_MS = 30000;
+const FEED_PAGE_CACHE_SIZE = 8;
+const feedPageCache = new Map();
+let feedPageCacheGeneration = 0; // bumped on clear so in-flight prefetches don't repopulate it
+
+function feedPageKey(offset, categoryFilter) {
+    return `${offset}|${categoryFilter || ''}`;
+}
+
+function clearFeedPageCache() {
+    feedPageCache.clear();
+    feedPageCacheGeneration++;
+}
+
+function getCachedFeedPage(offset, categoryFilter) {
+    const key = feedPageKey(offset, categoryFilter);
+    const cached = feedPageCache.get(key);
+    if (!cached) return null;
+    feedPageCache.delete(key);
+    if (Date.now() - cached.at >= FEED_PAGE_CACHE_MS) return null;
+    feedPageCache.set(key, cached); // most recently used goes last
+    return cached.bundle;
+}
+
+function cacheFeedPage(offset, categoryFilter, bundle) {
+    const key = feedPageKey(offset, categoryFilter);
+    feedPageCache.delete(key);
+    // Categories are cached separately (categoriesLoadedAt), so a cached page never re-renders them
+    feedPageCache.set(key, { bundle: { ...bundle, categories: null }, at: Date.now() });
+    if (feedPageCache.size > FEED_PAGE_CACHE_SIZE) {
+        feedPageCache.delete(feedPageCache.keys().next().value);
+    }
+}
+
+function prefetchNextPage(token, offset, categoryFilter) {
+    if (getCachedFeedPage(offset, categoryFilter)) return;
+    const whenIdle = window.requestIdleCallback || (cb => setTimeout(cb, 200));
+    whenIdle(async () => {
+        const generation = feedPageCacheGeneration;
+        try {
+            const response = await fetch(feedBundleUrl(offset, categoryFilter), {
+                headers: { 'Authorization': `Bearer ${token}` }
+            });
+            if (!response.ok) return;
+            const bundle = await response.json();
+            if (generation === feedPageCacheGeneration) cacheFeedPage(offset, categoryFilter, bundle);
+        } catch (error) {
+            // Best effort; "Next" falls back to a normal fetch
+        }
+    });
+}
+
 async function showFeed(offset = 0, categoryFilter = null) {
     const token = localStorage.getItem('token');
     if (!token) return;
     currentOffset = offset;
     currentCategoryFilter = categoryFilter;
+    if (feedAbort) feedAbort.abort();
+    const controller = feedAbort = new AbortController();
     try {
-        // Fetch user info for header
-        let userResp = await fetch('/auth/me', {
-            headers: { 'Authorization': `Bearer ${token}` }
-        });
-        let username = '';
-        if (userResp.ok) {
-            const userData = await userResp.json();
-            username = userData.username;
+        let bundle = getCachedFeedPage(offset, categoryFilter);
+        if (!bundle) {
+            // One request returns the user, the feed page and (unless cached) the categories
+            const response = await fetch(feedBundleUrl(offset, categoryFilter), {
+                headers: {
+                    'Authorization': `Bearer ${token}`
+                },
+                signal: controller.signal
+            });
+            if (!response.ok) {
+                clearToken();
+                showError('Session expired. Please sign in again.');
+                return;
+            }
+            bundle = await response.json();
+            if (controller.signal.aborted) return;
+            cacheFeedPage(offset, categoryFilter, bundle);
         }
-        // Set header
+        // Set header (textContent needs no HTML escaping)
         const headerTitle = document.getElementById('feed-header-title');
-        if (headerTitle && username) {
-            headerTitle.textContent = `Feed for ${escapeHtml(username)}`;
+        if (headerTitle) {
+            headerTitle.textContent = `Feed for ${bundle.user.username}`;
         }
-        let url = `/feed?limit=${FEED_LIMIT}&offset=${offset}`;
-        if (categoryFilter) {
-            url += `&category=${encodeURIComponent(categoryFilter)}`;
+        const feedItems = bundle.items;
+        dlog('[DEBUG] Feed API returned:', feedItems.length, 'items');
+        
+        displayFeed(feedItems);
+        updatePaginationControls(bundle.has_more);
+        if (bundle.categories) {
+            displayCategories(bundle.categories);
+            categoriesLoadedAt = Date.now();
         }
-        const response = await fetch(url, {
-            headers: {
-                'Authorization': `Bearer ${token}`
-            }
-        });
-        if (response.ok) {
-            const feedItems = await response.json();
-            console.log('[DEBUG] Feed API returned:', feedItems.length, 'items');
-            console.log('[DEBUG] Feed items:', feedItems);
-            
-            // Check for Reddit items specifically
-            const redditItems = feedItems.filter(item => item.source && item.source.includes('Reddit'));
-            console.log('[DEBUG] Reddit items found:', redditItems.length);
-            redditItems.forEach(item => {
-                console.log('[DEBUG] Reddit item:', {id: item.id, title: item.title, category: item.category, source: item.source});
-            });
-            
-            displayFeed(feedItems);
-            updatePaginationControls(feedItems.length);
-            loadCategories();
-            document.getElementById('auth-container').style.display = 'none';
-            document.getElementById('feed-container').style.display = 'block';
-        } else {
-            localStorage.removeItem('token');
-            showError('Session expired. Please sign in again.');
+        document.getElementById('auth-container').style.display = 'none';
+        document.getElementById('feed-container').style.display = 'block';
+        if (bundle.has_more) {
+            prefetchNextPage(token, offset + FEED_LIMIT, categoryFilter);
         }
     } catch (error) {
+        if (error.name === 'AbortError') return;
         showError('Failed to load feed.');
+    } finally {
+        if (feedAbort === controller) feedAbort = null;
     }
 }
 
-function updatePaginationControls(feedLength) {
+function updatePaginationControls(hasMore) {
     const controls = document.getElementById('pagination-controls');
     controls.innerHTML = '';
     
-    // Calculate current page and total pages
+    // Calculate current page; the server says whether another page exists
     const currentPage = Math.floor(currentOffset / FEED_LIMIT) + 1;
-    const totalPages = Math.ceil(feedLength / FEED_LIMIT) + (feedLength === FEED_LIMIT ? 1 : 0);
     
     // Previous button
     const prevBtn = document.createElement('button');
     prevBtn.textContent = '← Previous';
     prevBtn.disabled = currentOffset === 0;
     prevBtn.onclick = () => showFeed(Math.max(0, currentOffset - FEED_LIMIT), currentCategoryFilter);
-    prevBtn.style.cssText = 'background: #a8d5ba; color: #2c3e50; border: none; border-radius: 6px; padding: 3px 8px; font-size: 11px; font-weight: 500; cursor: pointer; transition: all 0.2s; margin-right: 10px;';
-    if (prevBtn.disabled) prevBtn.style.opacity = '0.5';
+    prevBtn.className = 'pagination-btn pagination-prev';
     controls.appendChild(prevBtn);
     
     // Page numbers
     const pageInfo = document.createElement('span');
-    pageInfo.textContent = `Page ${currentPage} of ${totalPages}`;
-    pageInfo.style.cssText = 'color: #666; font-size: 14px; font-weight: 500; margin: 0 15px;';
+    pageInfo.textContent = hasMore ? `Page ${currentPage}` : `Page ${currentPage} of ${currentPage}`;
+    pageInfo.className = 'pagination-info';
     controls.appendChild(pageInfo);
     
     // Next button
     const nextBtn = document.createElement('button');
     nextBtn.textContent = 'Next →';
-    nextBtn.disabled = feedLength < FEED_LIMIT;
+    nextBtn.disabled = !hasMore;
     nextBtn.onclick = () => showFeed(currentOffset + FEED_LIMIT, currentCategoryFilter);
-    nextBtn.style.cssText = 'background: #a8d5ba; color: #2c3e50; border: none; border-radius: 6px; padding: 3px 8px; font-size: 11px; font-weight: 500; cursor: pointer; transition: all 0.2s; margin-left: 10px;';
-    if (nextBtn.disabled) nextBtn.style.opacity = '0.5';
+    nextBtn.className = 'pagination-btn pagination-next';
     controls.appendChild(nextBtn);
 }
 
@@ -255,19 +351,27 @@ async function loadCategories() {
     const token = localStorage.getItem('token');
     if (!token) return;
     
+    if (categoriesAbort) categoriesAbort.abort();
+    const controller = categoriesAbort = new AbortController();
     try {
         const response = await fetch('/user/categories', {
             headers: {
                 'Authorization': `Bearer ${token}`
-            }
+            },
+            signal: controller.signal
         });
         
         if (response.ok) {
             const categories = await response.json();
+            if (controller.signal.aborted) return;
             displayCategories(categories);
+            categoriesLoadedAt = Date.now();
         }
     } catch (error) {
+        if (error.name === 'AbortError') return;
         console.error('Failed to load categories:', error);
+    } finally {
+        if (categoriesAbort === controller) categoriesAbort = null;
     }
 }
 
@@ -276,7 +380,7 @@ function displayCategories(categories) {
     container.innerHTML = '';
     
     if (categories.length === 0) {
-        container.innerHTML = '<p style="color: #666; font-style: italic;">No categories yet. Add your first category below!</p>';
+        container.innerHTML = '<p class="categories-empty">No categories yet. Add your first category below!</p>';
         return;
     }
     
@@ -287,21 +391,24 @@ function displayCategories(categories) {
         const displayName = category.short_summary && category.short_summary.trim() ? category.short_summary : category.category_name;
         const escapedDisplayName = escapeHtml(displayName);
         categoryDiv.innerHTML = `
-            <span class="category-name" data-category="${escapedDisplayName}" style="cursor: pointer; color: #a8d5ba; text-decoration: underline;">${escapedDisplayName}</span>
-            <button class="delete-category" onclick="deleteCategory(${category.id})">×</button>
+            <span class="category-name" data-category="${escapedDisplayName}">${escapedDisplayName}</span>
+            <button class="delete-category" data-category-id="${category.id}">×</button>
         `;
         container.appendChild(categoryDiv);
     });
-    
-    // Add event listeners for category names
-    setTimeout(() => {
-        document.querySelectorAll('.category-name').forEach(cat => {
-            cat.addEventListener('click', function() {
-                const category = this.getAttribute('data-category');
-                filterByCategory(category);
-            });
-        });
-    }, 50);
+}
+
+// Delegated listener for the categories list (bound once), instead of per-node handlers after each render
+function handleCategoriesClick(event) {
+    const name = event.target.closest('.category-name');
+    if (name) {
+        filterByCategory(name.getAttribute('data-category'));
+        return;
+    }
+    const deleteBtn = event.target.closest('.delete-category');
+    if (deleteBtn) {
+        deleteCategory(Number(deleteBtn.getAttribute('data-category-id')));
+    }
 }
 
 async function addCategory() {
@@ -325,6 +432,7 @@ async function addCategory() {
         const data = await response.json();
         if (response.ok) {
             document.getElementById('new-category').value = '';
+            clearFeedPageCache();
             loadCategories();
             showSuccess('Category added successfully! Generating your feed...');
             // Trigger feed generation for this user
@@ -343,18 +451,12 @@ async function triggerFeedGeneration() {
     const token = localStorage.getItem('token');
     if (!token) return;
     try {
-        // Get current user info to get user_id
-        const userResp = await fetch('/auth/me', {
-            headers: { 'Authorization': `Bearer ${token}` }
-        });
-        if (!userResp.ok) return;
-        const userData = await userResp.json();
-        
-        // Call the ingestion endpoint with correct format
-        const resp = await fetch(`/api/ingestion/ingest/perplexity?user_id=${userData.id}`, {
+        // The server takes the user from the token, so no user lookup is needed first
+        const resp = await fetch('/api/ingestion/ingest/perplexity', {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Authorization': `Bearer ${token}`
             }
         });
         if (resp.ok) {
@@ -385,7 +487,9 @@ async function deleteCategory(categoryId) {
         });
         const data = await response.json();
         if (response.ok) {
-            loadCategories();
+            // The feed refresh below fetches the categories again
+            categoriesLoadedAt = 0;
+            clearFeedPageCache();
             showSuccess('Category deleted successfully!');
             // Refresh the feed to remove items from this category
             await showFeed(0, null);
@@ -397,187 +501,240 @@ async function deleteCategory(categoryId) {
     }
 }
 
+// Age label nodes of the rendered feed with their parsed dates; collected on the first update
+// after each render instead of re-querying every card (and its label by id) on every tick
+let feedAgeTargets = null;
+
 function updateAllFeedAges() {
-    // For each feed-item, update the age label
-    const feedItems = document.querySelectorAll('.feed-item');
-    console.log(`Updating ages for ${feedItems.length} feed items`);
-    
-    feedItems.forEach((itemDiv, index) => {
-        const publishedAt = itemDiv.getAttribute('data-published-at');
-        const ageId = itemDiv.getAttribute('data-age-id');
-        
-        if (publishedAt && ageId) {
-            const ageDiv = document.getElementById(ageId);
-            if (ageDiv) {
-                const publishedDate = new Date(publishedAt);
-                const newAge = timeAgo(publishedDate);
-                ageDiv.textContent = newAge;
-                console.log(`Updated age for item ${index}: ${newAge}`);
-            } else {
-                console.log(`Age div not found for item ${index}, ageId: ${ageId}`);
+    if (!feedAgeTargets) {
+        feedAgeTargets = [];
+        document.querySelectorAll('.feed-item[data-published-at]').forEach(itemDiv => {
+            const node = document.getElementById(itemDiv.getAttribute('data-age-id'));
+            if (node) {
+                feedAgeTargets.push({ node, date: new Date(itemDiv.getAttribute('data-published-at')), label: node.textContent });
             }
-        } else {
-            console.log(`Missing data for item ${index}: publishedAt=${publishedAt}, ageId=${ageId}`);
+        });
+    }
+    // Compute first, then write only the labels that changed, all in one frame
+    // (most ticks change none: past two hours the label moves once an hour)
+    const changed = [];
+    for (const target of feedAgeTargets) {
+        const age = timeAgo(target.date);
+        if (age !== target.label) {
+            target.label = age;
+            changed.push(target);
+        }
+    }
+    if (changed.length === 0) return;
+    requestAnimationFrame(() => {
+        for (const target of changed) {
+            target.node.textContent = target.label;
         }
     });
 }
 
-// Update feed ages every minute and also immediately when feed loads
-setInterval(updateAllFeedAges, 60000);
+// Update feed ages every minute while signed in; ticks are skipped while the tab is hidden and
+// the labels catch up as soon as it is shown again
+let ageTimer = null;
+
+function startAgeTimer() {
+    if (ageTimer) return;
+    ageTimer = setInterval(() => {
+        if (document.visibilityState === 'visible') updateAllFeedAges();
+    }, 60000);
+}
+
+function stopAgeTimer() {
+    clearInterval(ageTimer);
+    ageTimer = null;
+}
+
+document.addEventListener('visibilitychange', () => {
+    if (ageTimer && document.visibilityState === 'visible') updateAllFeedAges();
+});
 
-// Also update ages immediately when feed is displayed
 function displayFeed(items) {
     const container = document.getElementById('feed-items');
-    container.innerHTML = '';
+    let html = '';
     
     // Add category filter header if filtering
     if (currentCategoryFilter) {
-        const filterHeader = document.createElement('div');
-        filterHeader.style.cssText = 'background:#f8f9fa;padding:15px;border-radius:10px;margin-bottom:20px;display:flex;justify-content:space-between;align-items:center;';
-        const escapedCategoryFilter = escapeHtml(currentCategoryFilter);
-        filterHeader.innerHTML = `
-            <span style="font-weight:600;color:#333;">Showing feeds from: <span style="color:#a8d5ba;">${escapedCategoryFilter}</span></span>
-            <button id="clear-filter-btn" style="background:#f8d7da;color:#721c24;border:none;border-radius:6px;padding:4px 8px;font-size:12px;font-weight:500;cursor:pointer;transition:all 0.2s;">Clear Filter</button>
+        html += `
+            <div class="feed-filter-header">
+                <span class="feed-filter-label">Showing feeds from: <span class="feed-filter-value">${escapeHtml(currentCategoryFilter)}</span></span>
+                <button id="clear-filter-btn" class="clear-filter-btn">Clear Filter</button>
+            </div>
         `;
-        container.appendChild(filterHeader);
     }
     
     if (items.length === 0) {
-        const emptyDiv = document.createElement('div');
-        emptyDiv.style.cssText = 'text-align:center;padding:40px;color:#666;font-style:italic;background:white;border-radius:15px;box-shadow:0 2px 8px rgba(0,0,0,0.05);';
-        emptyDiv.innerHTML = 'No feed items found. Try refreshing your briefings!';
-        container.appendChild(emptyDiv);
-        return;
+        html += `<div class="feed-empty">No feed items found. Try refreshing your briefings!</div>`;
     }
-    
+    // Cards are cloned from <template>s into one fragment, so the page is inserted in one go. Only the
+    // first cards are rendered up front; the rest start as placeholders filled in as they near the viewport.
+    const fragment = document.createDocumentFragment();
+    const eager = window.IntersectionObserver ? FEED_EAGER_ITEMS : items.length;
     items.forEach((item, idx) => {
-        const itemDiv = document.createElement('div');
-        itemDiv.className = 'feed-item';
-        let published = '';
-        let age = '';
-        let publishedDate = null;
-        if (item.published_at) {
-            publishedDate = new Date(item.published_at);
-            published = formatFullDate(publishedDate);
-            age = timeAgo(publishedDate);
-        }
-        // Combine summary and content for display
-        let feedText = '';
-        if (item.summary) {
-            feedText += item.summary || '';
+        if (idx < eager) {
+            fragment.appendChild(renderFeedItem(item, idx));
+        } else {
+            const placeholder = document.createElement('div');
+            placeholder.className = 'feed-item feed-item-pending';
+            placeholder.dataset.idx = idx;
+            fragment.appendChild(placeholder);
         }
-        if (item.content) {
-            if (feedText) {
-                feedText += ' ' + (item.content || '');
-            } else {
-                feedText += item.content || '';
-            }
+    });
+    // The age labels are rendered current (getFeedItemDates), so no follow-up pass over the new cards is needed
+    container.innerHTML = html;
+    container.appendChild(fragment);
+    feedAgeTargets = null;
+    observePendingFeedItems(container, items);
+}
+
+// Windowed rendering: cards beyond the first FEED_EAGER_ITEMS are rendered when they come within
+// FEED_RENDER_MARGIN of the viewport
+const FEED_EAGER_ITEMS = 6;
+const FEED_RENDER_MARGIN = '600px';
+let feedItemObserver = null;
+
+function observePendingFeedItems(container, items) {
+    if (feedItemObserver) feedItemObserver.disconnect();
+    const pending = container.querySelectorAll('.feed-item-pending');
+    if (pending.length === 0) return;
+    feedItemObserver = new IntersectionObserver((entries, observer) => {
+        for (const entry of entries) {
+            if (!entry.isIntersecting) continue;
+            observer.unobserve(entry.target);
+            const idx = Number(entry.target.getAttribute('data-idx'));
+            entry.target.replaceWith(renderFeedItem(items[idx], idx));
+            feedAgeTargets = null; // pick up the new card's age label on the next tick
         }
-        // Card layout with expandable text
-        const textId = `feed-card-text-${idx}`;
-        const moreId = `feed-card-more-${idx}`;
-        const ageId = `feed-card-age-${idx}`;
-        let needsMore = false;
-        if (feedText.length > 500) needsMore = true;
-        // Use short_summary for display if available, else fallback to category
-        let tagName = item.short_summary && item.short_summary.trim() ? item.short_summary : (item.category || 'Uncategorized');
-        console.log(`[DEBUG] Feed item ${item.id}: category='${item.category}', short_summary='${item.short_summary}', final tagName='${tagName}'`);
-        console.log(`[DEBUG] Reddit item data: title='${item.title}', content='${item.content}', source='${item.source}'`);
-        // Special Reddit card rendering
-        if (item.source && item.source.startsWith('Reddit r/')) {
-            itemDiv.innerHTML = `
-                <div class="reddit-card">
-                    <!-- Reddit Card Header with Category Tag -->
-                    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
-                        <div style="display: flex; align-items: center; gap: 8px;">
-                            <span style="background: #ff4500; color: white; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; font-weight: 600; cursor: pointer;" data-category="${escapeHtml(tagName)}" class="category-tag">${escapeHtml(tagName)}</span>
-                            <span style="color: #666; font-size: 0.85em;">•</span>
-                            <span style="color: #666; font-size: 0.85em;">${escapeHtml(item.source || 'Unknown')}</span>
-                        </div>
-                        <div style="text-align: right; font-size: 0.8em; color: #999;">
-                            <div id="${ageId}">${age || 'Unknown time'}</div>
-                            <div style="font-size: 0.95em; margin-top: 2px;">${published}</div>
-                        </div>
-                    </div>
-                    <!-- Reddit Card Content -->
-                    <div class="reddit-title">${escapeHtml(item.title || 'No title available')}</div>
-                    ${item.content ? `<div class="reddit-top-comment"><span style='color:#888;font-size:0.95em;'>Top comment:</span> ${escapeHtml(item.content)}</div>` : ''}
-                    ${!item.title && !item.content ? `<div style="color: #666; font-style: italic;">No content available</div>` : ''}
-                    <div class="reddit-meta">
-                        <a href="${escapeHtml(item.url)}" target="_blank">View on Reddit →</a>
-                    </div>
-                </div>
-            `;
+    }, { rootMargin: FEED_RENDER_MARGIN });
+    pending.forEach(placeholder => feedItemObserver.observe(placeholder));
+}
+
+function renderFeedItem(item, idx) {
+    let published = '';
+    let age = '';
+    let publishedDate = null;
+    if (item.published_at) {
+        const dates = getFeedItemDates(item);
+        publishedDate = dates.date;
+        published = dates.published;
+        age = dates.age;
+    }
+    // Combine summary and content for display (the list only carries a content preview)
+    const content = item.content_preview ? item.content_preview + (item.content_truncated ? '…' : '') : '';
+    let feedText = '';
+    if (item.summary) {
+        feedText += item.summary || '';
+    }
+    if (content) {
+        if (feedText) {
+            feedText += ' ' + content;
         } else {
-            // Default card rendering
-            itemDiv.innerHTML = `
-                <div style="display: flex; flex-direction: column;">
-                    <!-- Card Header -->
-                    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 12px;">
-                        <div style="display: flex; align-items: center; gap: 8px;">
-                            <span style="background: #a8d5ba; color: #2c3e50; padding: 4px 8px; border-radius: 12px; font-size: 0.8em; font-weight: 600; cursor: pointer;" data-category="${escapeHtml(tagName)}" class="category-tag">${escapeHtml(tagName)}</span>
-                            <span style="color: #666; font-size: 0.85em;">•</span>
-                            <span style="color: #666; font-size: 0.85em;">${escapeHtml(item.source || 'Unknown')}</span>
-                        </div>
-                        <div style="text-align: right; font-size: 0.8em; color: #999;">
-                            <div id="${ageId}">${age || 'Unknown time'}</div>
-                            <div style="font-size: 0.95em; margin-top: 2px;">${published}</div>
-                        </div>
-                    </div>
-                    <!-- Card Content -->
-                    <div style="display: flex; flex-direction: column;">
-                        <div id="${textId}" class="feed-card-text">${escapeHtml(feedText)}</div>
-                        ${needsMore ? `<span id="${moreId}" class="feed-card-more" data-text-id="${textId}" data-more-id="${moreId}">More</span>` : ''}
-                    </div>
-                    <!-- Card Footer -->
-                    ${item.url ? `<div style="display: flex; justify-content: flex-end; align-items: center; margin-top: 18px;">
-                        <a href="${escapeHtml(item.url)}" target="_blank" style="color: #a8d5ba; text-decoration: none; font-size: 0.85em; font-weight: 500;">Read More →</a>
-                    </div>` : ''}
-                </div>
-            `;
+            feedText += content;
         }
+    }
+    // Card layout with expandable text
+    const textId = `feed-card-text-${idx}`;
+    const moreId = `feed-card-more-${idx}`;
+    const ageId = `feed-card-age-${idx}`;
+    let needsMore = false;
+    if (feedText.length > 500 || item.content_truncated) needsMore = true;
+    // Use short_summary for display if available, else fallback to category
+    let tagName = item.short_summary && item.short_summary.trim() ? item.short_summary : (item.category || 'Uncategorized');
+    // Special Reddit card rendering
+    const isReddit = item.source && item.source.startsWith('Reddit r/');
+    const node = (isReddit ? redditCardTemplate : defaultCardTemplate).content.firstElementChild.cloneNode(true);
+    // Header shared by both layouts; text goes in via textContent, so nothing needs escaping
+    if (publishedDate) {
         // Store published date as data attribute for updating age
-        if (publishedDate) {
-            itemDiv.setAttribute('data-published-at', publishedDate.toISOString());
-            itemDiv.setAttribute('data-age-id', ageId);
-        }
-        container.appendChild(itemDiv);
-    });
-    
-    // Update ages immediately after displaying feed
-    setTimeout(updateAllFeedAges, 100);
-    
-    // Add event listeners for category tags and more buttons
-    setTimeout(() => {
-        // Add event listeners for category tags
-        document.querySelectorAll('.category-tag').forEach(tag => {
-            tag.addEventListener('click', function() {
-                const category = this.getAttribute('data-category');
-                filterByCategory(category);
-            });
-        });
-        
-        // Add event listeners for more buttons
-        document.querySelectorAll('.feed-card-more').forEach(btn => {
-            btn.addEventListener('click', function() {
-                const textId = this.getAttribute('data-text-id');
-                const moreId = this.getAttribute('data-more-id');
-                toggleFeedCardText(textId, moreId);
-            });
-        });
-        
-        // Add event listener for clear filter button
-        const clearFilterBtn = document.getElementById('clear-filter-btn');
-        if (clearFilterBtn) {
-            clearFilterBtn.addEventListener('click', clearCategoryFilter);
-        }
-    }, 50);
+        node.dataset.publishedAt = publishedDate.toISOString();
+        node.dataset.ageId = ageId;
+    }
+    const tag = node.querySelector('.category-tag');
+    tag.textContent = tagName;
+    tag.dataset.category = tagName;
+    node.querySelector('.card-source').textContent = item.source || 'Unknown';
+    const ageDiv = node.querySelector('.card-age');
+    ageDiv.id = ageId;
+    ageDiv.textContent = age || 'Unknown time';
+    node.querySelector('.card-published').textContent = published;
+    if (isReddit) {
+        fillRedditCard(node, item, content);
+    } else {
+        fillDefaultCard(node, item, feedText, needsMore, textId, moreId);
+    }
+    return node;
 }
 
-function filterByCategory(category) {
-    showFeed(0, category);
+// Card markup lives in index.html; each card is a clone of one of these
+const redditCardTemplate = document.getElementById('tpl-feed-reddit');
+const defaultCardTemplate = document.getElementById('tpl-feed-default');
+
+function fillRedditCard(node, item, content) {
+    node.querySelector('.reddit-title').textContent = item.title || 'No title available';
+    const comment = node.querySelector('.reddit-top-comment');
+    if (content) {
+        comment.querySelector('.card-comment-text').textContent = content;
+    } else {
+        comment.remove();
+    }
+    if (item.title || content) node.querySelector('.card-no-content').remove();
+    node.querySelector('.card-link').href = item.url || '';
+}
+
+function fillDefaultCard(node, item, feedText, needsMore, textId, moreId) {
+    const textDiv = node.querySelector('.feed-card-text');
+    textDiv.id = textId;
+    textDiv.textContent = feedText;
+    const more = node.querySelector('.feed-card-more');
+    if (needsMore) {
+        more.id = moreId;
+        more.dataset.textId = textId;
+        more.dataset.moreId = moreId;
+        if (item.content_truncated) more.dataset.itemId = item.id;
+    } else {
+        more.remove();
+    }
+    if (item.url) {
+        node.querySelector('.card-link').href = item.url;
+    } else {
+        node.querySelector('.card-footer').remove();
+    }
 }
 
+// One delegated listener for category tags, More/Less buttons and the clear-filter button,
+// instead of binding a handler to every card after each render
+function handleFeedItemsClick(event) {
+    const tag = event.target.closest('.category-tag');
+    if (tag) {
+        filterByCategory(tag.getAttribute('data-category'));
+        return;
+    }
+    const moreBtn = event.target.closest('.feed-card-more');
+    if (moreBtn) {
+        toggleFeedCardText(moreBtn.getAttribute('data-text-id'), moreBtn.getAttribute('data-more-id'));
+        return;
+    }
+    if (event.target.closest('#clear-filter-btn')) {
+        clearCategoryFilter();
+    }
+}
+
+// Trailing debounce: rapid calls collapse into one call with the last arguments
+function debounce(fn, ms) {
+    let timer;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
+// Clicking through several category tags quickly only loads the last one
+const filterByCategory = debounce(category => showFeed(0, category), 250);
+
 function clearCategoryFilter() {
     showFeed(0, null);
 }
@@ -595,12 +752,25 @@ function timeAgo(date) {
 }
 
 function logout() {
-    localStorage.removeItem('token');
+    clearToken();
     document.getElementById('auth-container').style.display = 'block';
     document.getElementById('feed-container').style.display = 'none';
     document.getElementById('login-form').classList.add('active');
     document.getElementById('signup-form').classList.remove('active');
     stopPeriodicFeedRefresh();
+    stopAgeTimer();
+}
+
+// One pending removal per banner element, so a reused banner isn't cleared early by an older timer
+const bannerTimers = new WeakMap();
+
+function flashBanner(div, message) {
+    div.textContent = message;
+    clearTimeout(bannerTimers.get(div));
+    bannerTimers.set(div, setTimeout(() => {
+        bannerTimers.delete(div);
+        div.remove();
+    }, 5000));
 }
 
 function showError(message) {
@@ -611,14 +781,10 @@ function showError(message) {
         let errorDiv = feedContainer.querySelector('.error');
         if (!errorDiv) {
             errorDiv = document.createElement('div');
-            errorDiv.className = 'error';
-            errorDiv.style.cssText = 'color: #ff4757; margin: 10px 0; padding: 10px; background: #ffe6e6; border-radius: 5px;';
+            errorDiv.className = 'error error-banner';
             feedContainer.insertBefore(errorDiv, feedContainer.firstChild);
         }
-        errorDiv.textContent = message;
-        setTimeout(() => {
-            errorDiv.remove();
-        }, 5000);
+        flashBanner(errorDiv, message);
         return;
     }
     
@@ -641,14 +807,10 @@ function showSuccess(message) {
         let successDiv = feedContainer.querySelector('.success');
         if (!successDiv) {
             successDiv = document.createElement('div');
-            successDiv.className = 'success';
-            successDiv.style.cssText = 'color: #2ed573; margin: 10px 0; padding: 10px; background: #e6ffe6; border-radius: 5px;';
+            successDiv.className = 'success success-banner';
             feedContainer.insertBefore(successDiv, feedContainer.firstChild);
         }
-        successDiv.textContent = message;
-        setTimeout(() => {
-            successDiv.remove();
-        }, 5000);
+        flashBanner(successDiv, message);
         return;
     }
     
@@ -690,6 +852,7 @@ async function refreshBriefings() {
             await pollTaskCompletion(data.task_id);
             
             // Reload the feed with current filter state
+            clearFeedPageCache();
             await showFeed(currentOffset, currentCategoryFilter);
             showSuccess('Briefings refreshed successfully!');
         } else {
@@ -706,22 +869,23 @@ async function refreshBriefings() {
 }
 
 async function pollTaskCompletion(taskId) {
-    const maxAttempts = 60; // 5 minutes (60 * 5 seconds)
-    let attempts = 0;
+    // Exponential backoff (1s, 1.7s, ~2.9s, ... capped at 10s): quick tasks are noticed quickly,
+    // long ones cost a handful of requests instead of one every 5 seconds
+    const deadline = Date.now() + 5 * 60 * 1000; // 5 minutes
+    const headers = { 'Authorization': `Bearer ${localStorage.getItem('token')}` };
+    let delay = 1000;
     
-    while (attempts < maxAttempts) {
+    while (Date.now() < deadline) {
+        await new Promise(resolve => setTimeout(resolve, delay));
+        delay = Math.min(delay * 1.7, 10000);
         try {
-            const response = await fetch(`/api/ingestion/task/${taskId}`, {
-                headers: {
-                    'Authorization': `Bearer ${localStorage.getItem('token')}`
-                }
-            });
+            const response = await fetch(`/api/ingestion/task/${taskId}`, { headers });
             
             if (response.ok) {
                 const taskData = await response.json();
                 
                 if (taskData.status === 'SUCCESS') {
-                    console.log('Task completed successfully');
+                    dlog('Task completed successfully');
                     return;
                 } else if (taskData.status === 'FAILURE') {
                     throw new Error('Task failed: ' + (taskData.result || 'Unknown error'));
@@ -731,32 +895,71 @@ async function pollTaskCompletion(taskId) {
         } catch (error) {
             console.error('Error polling task status:', error);
         }
-        
-        // Wait 5 seconds before next poll
-        await new Promise(resolve => setTimeout(resolve, 5000));
-        attempts++;
     }
     
     throw new Error('Task timed out after 5 minutes');
 }
 
+// Format: Mon, Dec 25, 2023 14:30:45 (24-hour)
+// One shared formatter instead of toLocaleString, which rebuilds the locale data on every call
+const fullDateFormat = new Intl.DateTimeFormat('en-US', {
+    weekday: 'short',
+    year: 'numeric',
+    month: 'short',
+    day: '2-digit',
+    hour: '2-digit',
+    minute: '2-digit',
+    second: '2-digit',
+    hour12: false
+});
+
 function formatFullDate(date) {
-    // Format: Mon, Dec 25, 2023 14:30:45 (24-hour)
-    return date.toLocaleString('en-US', {
-        weekday: 'short',
-        year: 'numeric',
-        month: 'short',
-        day: '2-digit',
-        hour: '2-digit',
-        minute: '2-digit',
-        second: '2-digit',
-        hour12: false
-    });
+    return fullDateFormat.format(date);
+}
+
+// Formatted dates per feed item id, so re-renders (filter clicks, refreshes) skip re-formatting.
+// The relative age is recomputed once it is older than FEED_AGE_CACHE_MS.
+const feedDateCache = new Map();
+const FEED_AGE_CACHE_MS = 30000;
+
+function getFeedItemDates(item) {
+    const now = Date.now();
+    let cached = feedDateCache.get(item.id);
+    if (!cached || cached.publishedAt !== item.published_at) {
+        const date = new Date(item.published_at);
+        cached = { publishedAt: item.published_at, date, published: formatFullDate(date), age: timeAgo(date), ts: now };
+        feedDateCache.set(item.id, cached);
+    } else if (now - cached.ts > FEED_AGE_CACHE_MS) {
+        cached.age = timeAgo(cached.date);
+        cached.ts = now;
+    }
+    return cached;
 }
 
-function toggleFeedCardText(textId, moreId) {
+async function loadFullFeedText(itemId, textDiv) {
+    // The feed list only ships a content preview; fetch the full item the first time it is expanded
+    const token = localStorage.getItem('token');
+    try {
+        const response = await fetch(`/feed/${itemId}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        });
+        if (response.ok) {
+            const item = await response.json();
+            textDiv.textContent = [item.summary, item.content].filter(Boolean).join(' ');
+        }
+    } catch (error) {
+        console.error('Failed to load full feed item:', error);
+    }
+}
+
+async function toggleFeedCardText(textId, moreId) {
     const textDiv = document.getElementById(textId);
     const moreSpan = document.getElementById(moreId);
+    if (moreSpan.dataset.itemId) {
+        const itemId = moreSpan.dataset.itemId;
+        delete moreSpan.dataset.itemId;
+        await loadFullFeedText(itemId, textDiv);
+    }
     if (textDiv.classList.contains('expanded')) {
         textDiv.classList.remove('expanded');
         moreSpan.textContent = 'More';
@@ -770,40 +973,40 @@ function toggleFeedCardText(textId, moreId) {
 let aiSummaryCollapsed = false;
 
 async function loadAISummary() {
-    console.log('loadAISummary called');
+    dlog('loadAISummary called');
     const token = localStorage.getItem('token');
-    console.log('Token found:', !!token);
+    dlog('Token found:', !!token);
     if (!token) {
-        console.log('No token, returning early');
+        dlog('No token, returning early');
         return;
     }
 
     try {
-        console.log('Showing banner...');
+        dlog('Showing banner...');
         // Show the banner first
         document.getElementById('ai-summary-banner').style.display = 'block';
-        console.log('Banner should now be visible');
+        dlog('Banner should now be visible');
         
         // Try to get existing summary
-        console.log('Fetching latest summary...');
+        dlog('Fetching latest summary...');
         const response = await fetch('/ai-summary/latest', {
             headers: { 'Authorization': `Bearer ${token}` }
         });
-        console.log('Response status:', response.status);
+        dlog('Response status:', response.status);
         
         if (response.ok) {
             const data = await response.json();
-            console.log('Response data:', data);
+            dlog('Response data:', data);
             if (data.has_summary) {
-                console.log('Displaying existing summary');
+                dlog('Displaying existing summary');
                 displayAISummary(data.summary);
             } else {
-                console.log('No existing summary, generating new one');
+                dlog('No existing summary, generating new one');
                 // No existing summary, generate one
                 await generateAISummary();
             }
         } else {
-            console.log('Error response, generating new summary');
+            dlog('Error response, generating new summary');
             // Error getting summary, generate new one
             await generateAISummary();
         }
@@ -934,10 +1137,10 @@ const originalShowFeed = showFeed;
 
 // Override showFeed to also load AI summary
 showFeed = async function(offset = 0, categoryFilter = null) {
-    console.log('Modified showFeed called with offset:', offset, 'categoryFilter:', categoryFilter);
+    dlog('Modified showFeed called with offset:', offset, 'categoryFilter:', categoryFilter);
     await originalShowFeed(offset, categoryFilter);
-    console.log('Original showFeed completed, now loading AI summary...');
+    dlog('Original showFeed completed, now loading AI summary...');
     // Load AI summary after feed is loaded
     await loadAISummary();
-    console.log('AI summary loading completed');
+    dlog('AI summary loading completed');
 };
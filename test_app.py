@@ -7,6 +7,7 @@ This can be used in CI/CD pipelines to verify the app works correctly
 import requests
 import sys
 import time
+import uuid
 
 def test_health_endpoint(base_url):
     """Test the health endpoint"""
@@ -50,18 +51,134 @@ def test_docs_endpoint(base_url):
         print(f"❌ Docs endpoint test failed: {e}")
         return False
 
+def test_root_not_modified(base_url):
+    """Test that the root page answers a matching If-None-Match with 304"""
+    try:
+        etag = requests.get(base_url, timeout=10).headers.get("ETag")
+        response = requests.get(base_url, headers={"If-None-Match": etag}, timeout=10)
+        if etag and response.status_code == 304:
+            print("✅ Root 304 test passed")
+            return True
+        else:
+            print(f"❌ Root 304 test failed: {response.status_code} (ETag {etag})")
+            return False
+    except Exception as e:
+        print(f"❌ Root 304 test failed: {e}")
+        return False
+
+def signup_test_user(base_url):
+    """Sign up a throwaway user and return its auth headers"""
+    username = f"smoke_{uuid.uuid4().hex[:12]}"
+    response = requests.post(f"{base_url}/auth/signup", json={
+        "username": username,
+        "email": f"{username}@example.com",
+        "password": "smoke-test-password"
+    }, timeout=30)
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+def delete_test_user(base_url, headers):
+    requests.delete(f"{base_url}/auth/user", headers=headers, timeout=30)
+
+def test_auth_required(base_url):
+    """Test that protected endpoints without a token are a 401"""
+    try:
+        statuses = {
+            path: requests.get(f"{base_url}{path}", timeout=10).status_code
+            for path in ("/auth/me", "/feed", "/feed/bundle", "/user/categories")
+        }
+        if all(code == 401 for code in statuses.values()):
+            print("✅ Auth required test passed")
+            return True
+        else:
+            print(f"❌ Auth required test failed: {statuses}")
+            return False
+    except Exception as e:
+        print(f"❌ Auth required test failed: {e}")
+        return False
+
+def test_auth_me_not_modified(base_url):
+    """Test that /auth/me answers a matching If-None-Match with 304"""
+    try:
+        headers = signup_test_user(base_url)
+        try:
+            etag = requests.get(f"{base_url}/auth/me", headers=headers, timeout=10).headers.get("ETag")
+            response = requests.get(f"{base_url}/auth/me", headers={**headers, "If-None-Match": etag}, timeout=10)
+        finally:
+            delete_test_user(base_url, headers)
+        if etag and response.status_code == 304:
+            print("✅ /auth/me 304 test passed")
+            return True
+        else:
+            print(f"❌ /auth/me 304 test failed: {response.status_code} (ETag {etag})")
+            return False
+    except Exception as e:
+        print(f"❌ /auth/me 304 test failed: {e}")
+        return False
+
+def test_feed_bundle_etag(base_url):
+    """Test that /feed/bundle returns 304 while unchanged and a new ETag after an insert"""
+    try:
+        headers = signup_test_user(base_url)
+        try:
+            bundle_url = f"{base_url}/feed/bundle?randomize=false"
+            etag = requests.get(bundle_url, headers=headers, timeout=30).headers.get("ETag")
+            not_modified = requests.get(bundle_url, headers={**headers, "If-None-Match": etag}, timeout=30)
+            requests.post(f"{base_url}/user/categories", headers=headers,
+                          json={"category_name": "Smoke test category"}, timeout=60).raise_for_status()
+            changed = requests.get(bundle_url, headers={**headers, "If-None-Match": etag}, timeout=30)
+        finally:
+            delete_test_user(base_url, headers)
+        if etag and not_modified.status_code == 304 and changed.status_code == 200 and changed.headers.get("ETag") != etag:
+            print("✅ /feed/bundle ETag test passed")
+            return True
+        else:
+            print(f"❌ /feed/bundle ETag test failed: {not_modified.status_code}, {changed.status_code} after insert")
+            return False
+    except Exception as e:
+        print(f"❌ /feed/bundle ETag test failed: {e}")
+        return False
+
+def test_deleted_account_token_rejected(base_url):
+    """Test that a token stops working once its account is deleted"""
+    try:
+        headers = signup_test_user(base_url)
+        delete_test_user(base_url, headers)
+        response = requests.get(f"{base_url}/user/categories", headers=headers, timeout=10)
+        if response.status_code == 401:
+            print("✅ Deleted account token test passed")
+            return True
+        else:
+            print(f"❌ Deleted account token test failed: {response.status_code}")
+            return False
+    except Exception as e:
+        print(f"❌ Deleted account token test failed: {e}")
+        return False
+
 def main():
     """Run all tests"""
     # Get base URL from command line or use default
-    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    base_url = args[0] if args else "http://localhost:8000"
     
     print(f"🧪 Testing application at: {base_url}")
     
+    # Read-only checks, safe to run against production
     tests = [
         test_health_endpoint,
         test_root_endpoint,
-        test_docs_endpoint
+        test_docs_endpoint,
+        test_root_not_modified,
+        test_auth_required
     ]
+    # These sign up, modify and delete throwaway accounts (and create a category, which calls
+    # Perplexity), so they only run against local/staging setups that opt in with --with-writes
+    if "--with-writes" in sys.argv[1:]:
+        tests += [
+            test_auth_me_not_modified,
+            test_feed_bundle_etag,
+            test_deleted_account_token_rejected
+        ]
     
     passed = 0
     total = len(tests)